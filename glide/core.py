@@ -1,7 +1,7 @@
 """Core classes used to power pipelines"""
 
 import asyncio
-from collections import defaultdict, OrderedDict
+from collections import defaultdict
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import copy
 
@@ -9,8 +9,9 @@ try:
     import cProfile as profile
 except ImportError:
     import profile
-from inspect import signature, Parameter
+from inspect import signature, Parameter, CO_VARARGS
 import os
+from types import FunctionType
 
 from consecution import (
     Pipeline,
@@ -18,10 +19,6 @@ from consecution import (
     Node as ConsecutionNode,
 )
 
-try:
-    from numpydoc.docscrape import FunctionDoc
-except ImportError:
-    FunctionDoc = None
 from tlbx import (
     st,
     repr,
@@ -37,6 +34,7 @@ from tlbx import (
 
 from glide.utils import (
     dbg,
+    dbg_enabled,
     info,
     raiseif,
     raiseifnot,
@@ -114,9 +112,9 @@ class Node(ConsecutionNode):
     context : dict
         The current context of the Node
     run_args : dict
-        An OrderedDict of positional args to run()
+        A dict of positional args to run(), in order
     run_kwargs : dict
-        An OrderedDict of keyword args and defaults to run()
+        A dict of keyword args and defaults to run(), in order
     run_requires_data : bool
         If true, the first positional arg to run is expected to be the
         data to process
@@ -125,6 +123,17 @@ class Node(ConsecutionNode):
 
     run_requires_data = True
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Specialize process() once per class instead of checking
+        # run_requires_data for every item. Classes that override process()
+        # keep Node.process as the target of their super() calls.
+        if cls.process in (Node.process, Node._process_data, Node._process_no_data):
+            if cls.run_requires_data:
+                cls.process = Node._process_data
+            else:
+                cls.process = Node._process_no_data
+
     def __init__(self, name, _log=False, _debug=False, **default_context):
         super().__init__(name)
         self._log = _log
@@ -151,10 +160,12 @@ class Node(ConsecutionNode):
             "Context must be dict-like, got %s" % type(context),
         )
         self.context.update(context)
+        self._run_arg_values = None
 
     def reset_context(self):
         """Reset context dict for this Node to the default"""
         self.context = copy.deepcopy(self.default_context)
+        self._run_arg_values = None
 
     def update_downstream_context(self, context, propagate=False):
         """Update the run context of downstream nodes
@@ -180,20 +191,80 @@ class Node(ConsecutionNode):
         for k, v in self.context.items():
             if isinstance(v, RuntimeContext):
                 self.context[k] = v()
+        self._run_arg_values = None
         super()._begin()
 
-    def _get_run_args(self):
-        """Get the args and kwargs of this Node's run() method"""
+    @classmethod
+    def _get_run_args(cls):
+        """Get the args and kwargs of this Node class's run() method. The
+        signature is only parsed once per class and copies of the cached
+        result are returned."""
+        cached = cls.__dict__.get("_run_args_cache", None)
+        if cached is None:
+            cached = cls._parse_run_args()
+            cls._run_args_cache = cached
+
+        positionals, keywords = cached
+        return positionals.copy(), keywords.copy()
+
+    @classmethod
+    def _parse_run_args(cls):
+        """Parse the args and kwargs of run() directly from its code object.
+        This is much cheaper than inspect.signature. Only regular positional
+        or keyword params and a **kwargs catch-all are allowed."""
+        func = cls.run
+        if not isinstance(func, FunctionType) or hasattr(func, "__wrapped__"):
+            return cls._parse_run_args_from_signature()
+
+        code = func.__code__
+        raiseif(
+            code.co_flags & CO_VARARGS, "VAR_POSITIONAL params are not allowed in run()"
+        )
+        raiseif(code.co_kwonlyargcount, "KEYWORD_ONLY params are not allowed in run()")
+
+        # Skip "self", and the data param if it is expected to be passed
+        # directly in process()
+        skip = 2 if cls.run_requires_data else 1
+        names = code.co_varnames[: code.co_argcount]
+        defaults = func.__defaults__ or ()
+        # Defaults line up with the trailing params, but positional-only
+        # params are treated as positionals even if they have defaults
+        first_default = len(names) - len(defaults)
+        num_positionals = max(first_default, getattr(code, "co_posonlyargcount", 0))
+
+        positionals = {}
+        keywords = {}
+        for i, name in enumerate(names):
+            if i < skip:
+                continue
 
-        positionals = OrderedDict()
-        keywords = OrderedDict()
-        sig = signature(self.run)
+            raiseif(
+                name in RESERVED_ARG_NAMES,
+                "Reserved arg name '%s' used in run()" % name,
+            )
+
+            if i < num_positionals:
+                positionals[name] = None
+            else:
+                keywords[name] = defaults[i - first_default]
+
+        return positionals, keywords
+
+    @classmethod
+    def _parse_run_args_from_signature(cls):
+        """Fallback to parse args and kwargs for a run() that is not a plain
+        function, such as a decorated method"""
+        positionals = {}
+        keywords = {}
+        sig = signature(cls.run)
+
+        # Skip "self", and the data param if it is expected to be passed
+        # directly in process()
+        skip = 2 if cls.run_requires_data else 1
 
         for i, param_name in enumerate(sig.parameters):
             param = sig.parameters[param_name]
-            if i == 0 and self.run_requires_data:
-                # The first param is the data to process which is passed
-                # directly in process()
+            if i < skip:
                 continue
 
             raiseif(
@@ -219,41 +290,66 @@ class Node(ConsecutionNode):
 
     def _get_run_arg_values(self):
         """Get the args to run() based on the current context"""
+        context = self.context
+        global_state = None
         _args = []
         for run_arg in self.run_args:
-            if run_arg not in self.context:
-                if self.global_state and run_arg in self.global_state:
-                    # Use global_state as a backup for populating positional args
-                    _args.append(self.global_state[run_arg])
-                else:
-                    raise Exception(
-                        'Required run arg "%s" is missing from context: %s'
-                        % (run_arg, self.context)
-                    )
-            else:
-                _args.append(self.context[run_arg])
+            if run_arg in context:
+                _args.append(context[run_arg])
+                continue
+
+            # Use global_state as a backup for populating positional args. It
+            # is only looked up through the pipeline if context is missing args.
+            if global_state is None:
+                global_state = self.global_state or {}
+            raiseifnot(
+                run_arg in global_state,
+                'Required run arg "%s" is missing from context: %s'
+                % (run_arg, context),
+            )
+            _args.append(global_state[run_arg])
 
         # Everything else in the node context will be passed as part of kwargs
         # if it hasn't already been used in run_args
         _kwargs = {}
-        for key in self.context:
+        for key, value in context.items():
             if key in self.run_args:
                 continue
-            _kwargs[key] = self.context[key]
+            _kwargs[key] = value
 
         return _args, _kwargs
 
     def process(self, data):
         """Required method used by Consecution to process nodes"""
-        arg_values, kwarg_values = self._get_run_arg_values()
+        if self.run_requires_data:
+            self._process_data(data)
+        else:
+            self._process_no_data(data)
+
+    def _process_data(self, data):
+        """The process() used by classes whose run() takes data"""
+        # The context is only expected to change through update_context() or
+        # reset_context(), so the run() arg values are reused between changes
+        if self._run_arg_values is None:
+            self._run_arg_values = self._get_run_arg_values()
+        arg_values, kwarg_values = self._run_arg_values
+        self._log_data(data)
+        self._run(data, *arg_values, **kwarg_values)
+
+    def _process_no_data(self, data):
+        """The process() used by classes whose run() does not take data"""
+        if self._run_arg_values is None:
+            self._run_arg_values = self._get_run_arg_values()
+        arg_values, kwarg_values = self._run_arg_values
+        self._log_data(data)
+        self._run(*arg_values, **kwarg_values)
+
+    def _log_data(self, data):
         if self._log:
             print(format_msg(repr(data), label=self.name))
-        else:
+        elif dbg_enabled():
+            # Only pay for repr() when the message will actually be logged
             dbg("size:%s %s" % (size(data), repr(data)), label=self.name)
-        if self.run_requires_data:
-            self._run(data, *arg_values, **kwarg_values)
-        else:
-            self._run(*arg_values, **kwarg_values)
 
     def _run(self, *args, **kwargs):
         if self._debug:
@@ -317,7 +413,37 @@ class NoInputNode(Node):
 
 
 class PushNode(Node):
-    """A node that just passes all data through in run()"""
+    """A node that just passes all data through in run()
+
+    Attributes
+    ----------
+    _pure_passthrough : bool
+        True if the class does not override run(), in which case process()
+        pushes data directly without populating run() args from the context.
+
+    """
+
+    _pure_passthrough = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._pure_passthrough = cls.run is PushNode.run
+        # Only keep the pass-through process() on classes that keep run().
+        # Others get the same specialized process() as any other Node.
+        if cls.process in (PushNode.process, Node._process_data, Node._process_no_data):
+            if cls._pure_passthrough:
+                cls.process = PushNode.process
+            elif cls.run_requires_data:
+                cls.process = Node._process_data
+            else:
+                cls.process = Node._process_no_data
+
+    def process(self, data):
+        """Push data straight through if run() would do nothing else"""
+        if self._pure_passthrough and not (self._log or self._debug or dbg_enabled()):
+            self.push(data)
+            return
+        super().process(data)
 
     def run(self, data, **kwargs):
         self.push(data)
@@ -927,7 +1053,10 @@ class Glider:
 
 
 class ParaGlider(Glider):
-    """
+    """A Glider that executes parallel calls to consume(). The executor is
+    created on the first call to consume() and reused by subsequent calls
+    until close() is called. A ParaGlider may also be used as a context
+    manager to close the executor automatically.
 
     Parameters
     ----------
@@ -949,12 +1078,40 @@ class ParaGlider(Glider):
 
     def __init__(self, *args, executor_kwargs=None, **kwargs):
         self.executor_kwargs = executor_kwargs or {}
+        self._executor = None
         super().__init__(*args, **kwargs)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def get_executor(self):
         """Override this method to create the parallel executor"""
         raise NotImplementedError
 
+    def shutdown_executor(self, executor):
+        """Override this method to shutdown the parallel executor"""
+        executor.shutdown(wait=True)
+
+    def _get_executor(self):
+        """Get the executor, creating it if this is the first use or if the
+        previous one was broken, such as by a worker process dying"""
+        if getattr(self._executor, "_broken", False):
+            self.close()
+        if self._executor is None:
+            self._executor = self.get_executor()
+        return self._executor
+
+    def close(self):
+        """Shutdown the executor if one has been created"""
+        if self._executor is None:
+            return
+        executor = self._executor
+        self._executor = None
+        self.shutdown_executor(executor)
+
     def get_worker_count(self, executor):
         """Override this method to get the active worker count from the executor"""
         raise NotImplementedError
@@ -995,36 +1152,36 @@ class ParaGlider(Glider):
             Keyword arguments that are node_name->param_dict
 
         """
-        with self.get_executor() as executor:
-            worker_count = self.get_worker_count(executor)
-            split_count = split_count_helper(data, split_count or worker_count)
-            if data is None:
-                splits = [None for s in range(split_count)]
-            else:
-                splits = divide_data(data, split_count)
-            futures = []
+        executor = self._get_executor()
+        worker_count = self.get_worker_count(executor)
+        split_count = split_count_helper(data, split_count or worker_count)
+        if data is None:
+            splits = [None for s in range(split_count)]
+        else:
+            splits = divide_data(data, split_count)
+        futures = []
 
-            info(
-                "%s: data len: %s, splits: %d, workers: %d"
-                % (
-                    self.__class__.__name__,
-                    size(data, "n/a"),
-                    worker_count,
-                    split_count,
-                )
+        info(
+            "%s: data len: %s, splits: %d, workers: %d"
+            % (
+                self.__class__.__name__,
+                size(data, "n/a"),
+                worker_count,
+                split_count,
             )
+        )
 
-            for split in splits:
-                futures.append(
-                    executor.submit(
-                        consume, self.pipeline, split, cleanup=cleanup, **node_contexts
-                    )
+        for split in splits:
+            futures.append(
+                executor.submit(
+                    consume, self.pipeline, split, cleanup=cleanup, **node_contexts
                 )
+            )
 
-            if synchronous:
-                return self.get_results(futures, timeout=timeout)
+        if synchronous:
+            return self.get_results(futures, timeout=timeout)
 
-            return futures
+        return futures
 
 
 class ProcessPoolParaGlider(ParaGlider):
@@ -1075,6 +1232,9 @@ class GliderScript(Script):
 
     """
 
+    # Parsed run() help per Node class, shared by all instances
+    _node_help_cache = {}
+
     def __init__(
         self,
         glider,
@@ -1112,6 +1272,11 @@ class GliderScript(Script):
             )
 
         self._check_arg_conflicts()
+        self._node_names = frozenset(self.glider.get_node_lookup())
+        self._node_arg_map = self._get_node_arg_map()
+        self._arg_name_node_map = self._get_arg_name_node_map()
+        self._node_inject_args = self._get_node_inject_args()
+        self._blacklisted_node_args = self._get_blacklisted_node_args()
         all_script_args = self._get_script_args()
         return super().__init__(*all_script_args)
 
@@ -1167,10 +1332,18 @@ class GliderScript(Script):
         """Determine if an argument has been blacklisted from the CLI"""
         if arg_name in self.blacklist:
             return True
-        if self._get_script_arg_name(node_name, arg_name) in self.blacklist:
+        if (node_name, arg_name) in self._blacklisted_node_args:
             return True
         return False
 
+    def _get_blacklisted_node_args(self):
+        """Get the set of (node_name, arg_name) pairs blacklisted by their
+        full script arg name"""
+        blacklisted = set()
+        for name in self.blacklist:
+            blacklisted.update(self._node_arg_map.get(name, []))
+        return blacklisted
+
     def _get_custom_arg_dests(self):
         return [a.dest for a in self.custom_args]
 
@@ -1194,24 +1367,46 @@ class GliderScript(Script):
                 arg_map[kwarg_name].add(node.name)
         return arg_map
 
-    def _get_arg_node_name(self, arg):
-        names = []
+    def _get_node_arg_map(self):
+        """Map possible script arg dests to (node_name, arg_name) pairs"""
+        node_arg_map = defaultdict(list)
         node_lookup = self.glider.get_node_lookup()
         for node in node_lookup.values():
-            if not arg.startswith(node.name + "_"):
-                continue
+            for arg_name in list(node.run_args) + list(node.run_kwargs):
+                dest = self._get_script_arg_name(node.name, arg_name)
+                node_arg_map[dest].append((node.name, arg_name))
+        return node_arg_map
+
+    def _get_node_inject_args(self):
+        """Map node names to the names of their args that are injected"""
+        inject_args = {}
+        if not self.inject:
+            return inject_args
 
-            arg_base_name = arg[len(node.name) + 1 :]
-            if arg_base_name in node.run_args or arg_base_name in node.run_kwargs:
-                names.append(node.name)
+        node_lookup = self.glider.get_node_lookup()
+        for node in node_lookup.values():
+            arg_names = [
+                arg_name
+                for arg_name in list(node.run_args) + list(node.run_kwargs)
+                if arg_name in self.inject
+            ]
+            if arg_names:
+                inject_args[node.name] = arg_names
+        return inject_args
+
+    def _get_node_arg(self, arg):
+        """Get the (node_name, arg_name) pair for a script arg dest, or
+        (None, None) if it does not map to a node arg"""
+        node_args = self._node_arg_map.get(arg, None)
+        if not node_args:
+            return None, None
 
         raiseifnot(
-            len(names) <= 1,
-            "More than one node found for arg name %s: %s" % (arg, names),
+            len(node_args) == 1,
+            "More than one node found for arg name %s: %s"
+            % (arg, [x[0] for x in node_args]),
         )
-        if not names:
-            return None
-        return names[0]
+        return node_args[0]
 
     def _get_script_arg_name(self, node_name, arg_name):
         return "%s_%s" % (node_name, arg_name)
@@ -1278,10 +1473,35 @@ class GliderScript(Script):
             )
         return script_arg
 
+    def _get_node_help(self, node):
+        """Get a map of run() arg names to help strings parsed from the run()
+        docs. Parsing is only done once per Node class."""
+        cls = node.__class__
+        if cls in self._node_help_cache:
+            return self._node_help_cache[cls]
+
+        try:
+            # Deferred until a CLI is built, most pipelines never need it
+            from numpydoc.docscrape import FunctionDoc
+        except ImportError:
+            FunctionDoc = None
+
+        node_help = {}
+        if FunctionDoc:
+            try:
+                # Only works if run() has docs in numpydoc format
+                docs = FunctionDoc(cls.run)
+                node_help = {v.name: "\n".join(v.desc) for v in docs["Parameters"]}
+            except Exception as e:
+                info("failed to parse node '%s' run() docs: %s" % (node.name, str(e)))
+
+        self._node_help_cache[cls] = node_help
+        return node_help
+
     def _get_script_args(self):
         """Generate all tlbx Args for this Glider"""
         node_lookup = self.glider.get_node_lookup()
-        script_args = OrderedDict()  # Map of arg names to Args
+        script_args = {}  # Map of arg names to Args
         arg_dests = {}  # Map of arg dests back to names
         node_arg_names = defaultdict(set)
 
@@ -1299,16 +1519,7 @@ class GliderScript(Script):
             node_arg_names[arg_name].add(script_arg.name)
 
         for node in node_lookup.values():
-            node_help = {}
-            if FunctionDoc:
-                try:
-                    # Only works if run() has docs in numpydoc format
-                    docs = FunctionDoc(node.run)
-                    node_help = {v.name: "\n".join(v.desc) for v in docs["Parameters"]}
-                except Exception as e:
-                    info(
-                        "failed to parse node '%s' run() docs: %s" % (node.name, str(e))
-                    )
+            node_help = self._get_node_help(node)
 
             for arg_name, _ in node.run_args.items():
                 add_script_arg(
@@ -1375,24 +1586,15 @@ class GliderScript(Script):
     def _get_injected_node_contexts(self, kwargs):
         """Populate node contexts based on injected args"""
         node_contexts = {}
-        node_lookup = self.glider.get_node_lookup()
-
-        for node in node_lookup.values():
-            for arg_name, _ in node.run_args.items():
-                if arg_name in self.inject:
-                    node_contexts.setdefault(node.name, {})[arg_name] = kwargs[arg_name]
-
-            for kwarg_name, _ in node.run_kwargs.items():
-                if kwarg_name in self.inject:
-                    node_contexts.setdefault(node.name, {})[kwarg_name] = kwargs[
-                        kwarg_name
-                    ]
-
+        for node_name, arg_names in self._node_inject_args.items():
+            node_contexts[node_name] = {
+                arg_name: kwargs[arg_name] for arg_name in arg_names
+            }
         return node_contexts
 
     def _convert_kwargs(self, kwargs):
         """Convert flat kwargs to node contexts and remaining kwargs"""
-        nodes = self.glider.get_node_lookup()
+        nodes = self._node_names
         node_contexts = {}
         add_to_final = set()
 
@@ -1401,12 +1603,11 @@ class GliderScript(Script):
                 key in nodes, "Invalid keyword arg '%s', can not be a node name" % (key)
             )
 
-            node_name = self._get_arg_node_name(key)
+            node_name, arg_name = self._get_node_arg(key)
             if node_name not in nodes:
                 add_to_final.add(key)
                 continue
 
-            arg_name = key[len(node_name) + 1 :]
             node_contexts.setdefault(node_name, {})[arg_name] = value
 
         injected_node_contexts = self._get_injected_node_contexts(kwargs)
@@ -1416,7 +1617,7 @@ class GliderScript(Script):
             else:
                 node_contexts[node_name] = injected_args
 
-        arg_node_map = self._get_arg_name_node_map()
+        arg_node_map = self._arg_name_node_map
         for custom_arg_dest in self._get_custom_arg_dests():
             if custom_arg_dest not in kwargs:
                 continue
@@ -331,8 +331,9 @@ class CeleryReduce(Reduce):
 
     def end(self):
         """Do the push once all results are in"""
-        dbg("Waiting for %d celery task(s)..." % len(self.results))
-        result_set = ResultSet(self.results)
+        async_results = self.take_results()
+        dbg("Waiting for %d celery task(s)..." % len(async_results))
+        result_set = ResultSet(async_results)
         results = result_set.get(
             timeout=self.context.get("timeout", None),
             propagate=self.context.get("propagate", True),
@@ -10,12 +10,11 @@ except ImportError:
     Client = None
     dask_as_completed = None
 import pandas as pd
-import numpy as np
 from tlbx import st, set_missing_key
 
 from glide.core import Node, PushNode, ParaGlider, PoolSubmit
 from glide.flow import FuturesPush, Reduce
-from glide.utils import dbg, is_pandas, raiseif, raiseifnot
+from glide.utils import dbg, divide_data, is_pandas, raiseif, raiseifnot
 
 
 class DaskClientPush(FuturesPush):
@@ -28,6 +27,9 @@ class DaskClientPush(FuturesPush):
         raiseifnot(Client, "Please install dask (Client) to use DaskClientPush")
         super().run(*args, **kwargs)
 
+    def shutdown_executor(self, executor):
+        executor.close()
+
 
 class DaskDelayedPush(PushNode):
     """Use dask delayed to do a parallel push"""
@@ -45,9 +47,9 @@ class DaskDelayedPush(PushNode):
 
         lazy = []
         if self.context.get("split", False):
-            splits = np.array_split(data, len(self._downstream_nodes))
-            for i, downstream in enumerate(self._downstream_nodes):
-                lazy.append(delayed(downstream._process)(splits[i]))
+            splits = divide_data(data, len(self._downstream_nodes))
+            for downstream, split in zip(self._downstream_nodes, splits):
+                lazy.append(delayed(downstream._process)(split))
         else:
             for downstream in self._downstream_nodes:
                 lazy.append(delayed(downstream._process)(data))
@@ -63,6 +65,9 @@ class DaskParaGlider(ParaGlider):
         raiseifnot(Client, "Please install dask (Client) to use DaskParaGlider")
         return Client(**self.executor_kwargs)
 
+    def shutdown_executor(self, executor):
+        executor.close()
+
     def get_worker_count(self, executor):
         return len(executor.ncores())
 
@@ -116,9 +121,10 @@ class DaskFuturesReduce(Reduce):
         Dask futures will not work if you have closed your client connection!
 
         """
-        dbg("Waiting for %d Dask futures..." % len(self.results))
+        futures = self.take_results()
+        dbg("Waiting for %d Dask futures..." % len(futures))
         results = []
-        for _, result in dask_as_completed(self.results, with_results=True):
+        for _, result in dask_as_completed(futures, with_results=True):
             results.append(result)
         if results and self.context.get("flatten", False):
             results = pd.concat(results)
@@ -0,0 +1,91 @@
+"""http://numba.pydata.org/"""
+
+try:
+    import numba
+    from numba.core.errors import NumbaError
+except ImportError:
+    numba = None
+    NumbaError = None
+
+from glide.core import Node
+from glide.utils import raiseifnot, warn
+
+
+class NumbaApply(Node):
+    """Apply a Numba-compiled function to the data, such as a numpy array or
+    one of the splits pushed by a SplitPush node"""
+
+    # Compiled functions are shared by all nodes, keyed by function and
+    # options. Entries live as long as the process, so pass module-level
+    # functions rather than creating new lambdas for each run.
+    _jit_cache = {}
+
+    @classmethod
+    def get_jit_func(cls, func, parallel=False, cache=True):
+        """Get a compiled version of func, compiling it on first use
+
+        Parameters
+        ----------
+        func : callable
+            A plain python function or one already decorated with numba.njit
+        parallel : bool, optional
+            Passed through to numba.njit to enable automatic parallelization
+        cache : bool, optional
+            Passed through to numba.njit to cache compiled code on disk so it
+            survives interpreter restarts
+
+        Returns
+        -------
+        A numba dispatcher for func, or the plain python function if an
+        earlier call fell back to it
+
+        """
+        key = (func, parallel, cache)
+        jit_func = cls._jit_cache.get(key, None)
+        if jit_func is None:
+            if hasattr(func, "py_func"):
+                # Already compiled by the caller, options are theirs to set
+                jit_func = func
+            else:
+                jit_func = numba.njit(func, parallel=parallel, cache=cache)
+            cls._jit_cache[key] = jit_func
+        return jit_func
+
+    def run(self, data, func, parallel=False, cache=True, fallback=False, **kwargs):
+        """Call a Numba-compiled version of func on the data and push the result
+
+        Parameters
+        ----------
+        data
+            The data to pass to func, typically a numpy array
+        func : callable
+            A numeric function that Numba can compile in nopython mode. The
+            compiled function is reused across items and nodes.
+        parallel : bool, optional
+            Passed through to numba.njit
+        cache : bool, optional
+            Passed through to numba.njit. Functions defined interactively
+            can not be cached to disk and require cache=False.
+        fallback : bool, optional
+            If true and Numba fails to compile func for the data, log a
+            warning and call the original python function instead. The
+            python function is then used for all later calls with the same
+            func and options.
+        **kwargs
+            Keyword arguments passed to func
+
+        """
+        raiseifnot(numba, "The numba package is not installed")
+
+        jit_func = self.get_jit_func(func, parallel=parallel, cache=cache)
+        try:
+            result = jit_func(data, **kwargs)
+        except NumbaError as e:
+            if not fallback:
+                raise
+            warn("Numba compilation failed, using python: %s" % e, label=self.name)
+            # Numba retries a failed compile on every call, so remember it
+            py_func = jit_func.py_func
+            self._jit_cache[(func, parallel, cache)] = py_func
+            result = py_func(data, **kwargs)
+        self.push(result)
@@ -10,7 +10,7 @@ from tlbx import st
 from glide.core import Node
 from glide.sql import BaseSQLNode
 from glide.sql_utils import build_table_select, get_temp_table, SQLALCHEMY_CONN_TYPES
-from glide.utils import warn, listify, raiseif, raiseifnot
+from glide.utils import warn, listify, is_pandas, raiseif, raiseifnot
 
 
 class ToDataFrame(Node):
@@ -77,16 +77,21 @@ class DataFramePushMixin:
         Parameters
         ----------
         df : pandas.DataFrame
-            DataFrame to push, or chunks of a DataFrame if the chunksize
-            argument is passed and truthy.
+            DataFrame to push, or an iterator of DataFrame chunks such as the
+            result of pandas.read_csv with a chunksize.
         chunksize : int, optional
-            If truthy the df argument is expected to be chunks of a DataFrame
-            that will be pushed individually.
+            If truthy the data will be pushed in chunks. A DataFrame is sliced
+            into chunks of this size, while an iterator of chunks is pushed
+            chunk by chunk.
         """
 
         if chunksize:
-            for chunk in df:
-                self.push(chunk)
+            if is_pandas(df):
+                for start in range(0, len(df), chunksize):
+                    self.push(df.iloc[start : start + chunksize])
+            else:
+                for chunk in df:
+                    self.push(chunk)
         else:
             self.push(df)
 
@@ -353,7 +358,7 @@ class DataFrameSQLTempLoad(PandasSQLNode):
         raiseifnot(pd, "Please install Pandas to use this class")
 
         raiseif(
-            isinstance(conn, sqlite3.Connection),
+            self._is_sqlite_conn(conn),
             "sqlite3 connections not supported due to bug in Pandas' has_table()",
         )
 
@@ -236,8 +236,9 @@ class RQReduce(Reduce):
 
     def end(self):
         """Do the push once all results are in"""
-        dbg("Waiting for %d RQ job(s)..." % len(self.results))
-        results = get_async_results(self.results)
+        jobs = self.take_results()
+        dbg("Waiting for %d RQ job(s)..." % len(jobs))
+        results = get_async_results(jobs)
         if results and self.context.get("flatten", False):
             results = flatten(results)
         self.push(results)
@@ -141,8 +141,9 @@ class SQLExtract(SQLNode):
             SQL connection cursor type when creating a cursor is necessary
         params : tuple or dict, optional
             A tuple or dict of params to pass to the execute method
-        chunksize : int, optional
-            Fetch and push data in chunks of this size
+        chunksize : int or bool, optional
+            Fetch and push data in chunks of this size. If True, use
+            DEFAULT_FETCH_CHUNKSIZE. By default all rows are fetched at once.
         **kwargs
             Keyword arguments pushed to the execute method
 
@@ -174,8 +175,9 @@ class SQLParamExtract(SQLExtract):
             SQL connection cursor object
         cursor_type : optional
             SQL connection cursor type when creating a cursor is necessary
-        chunksize : int, optional
-            Fetch and push data in chunks of this size
+        chunksize : int or bool, optional
+            Fetch and push data in chunks of this size. If True, use
+            DEFAULT_FETCH_CHUNKSIZE. By default all rows are fetched at once.
         **kwargs
             Keyword arguments pushed to the execute method
 
@@ -224,8 +226,9 @@ class SQLTableExtract(SQLNode):
             Limit to put in SQL limit clause
         params : tuple or dict, optional
             A tuple or dict of params to pass to the execute method
-        chunksize : int, optional
-            Fetch and push data in chunks of this size
+        chunksize : int or bool, optional
+            Fetch and push data in chunks of this size. If True, use
+            DEFAULT_FETCH_CHUNKSIZE. By default all rows are fetched at once.
         **kwargs
             Keyword arguments passed to cursor.execute
 
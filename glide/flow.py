@@ -1,5 +1,6 @@
 import asyncio
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import pickle
 import shutil
 
 import numpy as np
@@ -161,11 +162,27 @@ class Join(Node):
         self.push(join(data, on=on, how=how, rsuffixes=rsuffixes))
 
 
+class ExecutorModes:
+    """The names of executor modes supported by FuturesPush nodes"""
+
+    Auto = "auto"
+    Process = "process"
+    Thread = "thread"
+
+
 class FuturesPush(PushNode):
     """A node that either splits or duplicates its input to pass to multiple
     downstream nodes in parallel according to the executor_class that supports
     the futures interface. If an executor_kwargs dict is in the context of
-    this node it will be passed to the parallel executor.
+    this node it will be passed to the parallel executor. If an executor is
+    in the context it will be used instead of creating one, and it is left
+    running at the end of the pipeline so it can be shared across nodes and
+    runs.
+
+    An executor_mode in the context overrides executor_class. It may be
+    "process", "thread" or "auto". In "auto" mode a process pool is used only
+    if the downstream nodes can be pickled, otherwise it falls back to a
+    thread pool.
 
     Parameters
     ----------
@@ -184,37 +201,117 @@ class FuturesPush(PushNode):
 
     executor_class = ProcessPoolExecutor
     as_completed_func = as_completed
+    _executor = None
+    _shutdown_executor = True
+
+    def __getstate__(self):
+        """Executors can not be pickled, so leave them out when this node gets
+        sent to a worker process along with its downstream nodes"""
+        state = self.__dict__.copy()
+        state.pop("_executor", None)
+        if "executor" in self.context:
+            state["context"] = {
+                k: v for k, v in self.context.items() if k != "executor"
+            }
+        return state
+
+    def get_executor_class(self):
+        """Get the executor class based on the executor_mode context setting"""
+        mode = self.context.get("executor_mode", None)
+        if not mode:
+            return self.executor_class
+        if mode == ExecutorModes.Process:
+            return ProcessPoolExecutor
+        if mode == ExecutorModes.Thread:
+            return ThreadPoolExecutor
+        if mode == ExecutorModes.Auto:
+            try:
+                pickle.dumps(self._downstream_nodes)
+            except Exception as e:
+                info(
+                    "%s: downstream nodes can not be pickled, using threads: %s"
+                    % (self.__class__.__name__, str(e))
+                )
+                return ThreadPoolExecutor
+            return ProcessPoolExecutor
+        raise AssertionError("Invalid executor_mode: %s" % mode)
+
+    def get_executor(self, **executor_kwargs):
+        """Create the executor used for the lifetime of a run"""
+        return self.get_executor_class()(**executor_kwargs)
+
+    def shutdown_executor(self, executor):
+        """Shutdown the executor once all data has been pushed"""
+        executor.shutdown(wait=True)
+
+    def begin(self):
+        """Get a single executor to be reused for every push"""
+        # A failed run never calls end(), so release any executor left over
+        self.end()
+
+        executor = self.context.get("executor", None)
+        if executor:
+            self._executor = executor
+            self._shutdown_executor = False
+            return
+
+        executor_kwargs = self.context.get("executor_kwargs", None) or {}
+        self._executor = self.get_executor(**executor_kwargs)
+        self._shutdown_executor = True
+
+    def end(self):
+        """Shutdown the executor if it was created by this node"""
+        if self._executor is not None:
+            executor = self._executor
+            self._executor = None
+            if self._shutdown_executor:
+                self.shutdown_executor(executor)
 
     def _push(self, data):
         """Override Consecution's push such that we can push in parallel"""
         if self._logging == "output":
             self._write_log(data)
 
-        executor_kwargs = self.context.get("executor_kwargs", None) or {}
-        with self.executor_class(**executor_kwargs) as executor:
-            futures = []
-
-            do_split = self.context.get("split", False)
-            info(
-                "%s: split=%s, %d downstream nodes"
-                % (self.__class__.__name__, do_split, len(self._downstream_nodes)),
-                label="push",
-            )
+        if self._executor is None:
+            # No executor from begin(), such as in a copy of this node sent to
+            # a worker process, so use one just for this push
+            executor_kwargs = self.context.get("executor_kwargs", None) or {}
+            with self.get_executor(**executor_kwargs) as executor:
+                self._push_with_executor(executor, data)
+            return
 
-            if do_split:
-                # Split the data among the downstream nodes
-                splits = divide_data(data, len(self._downstream_nodes))
-                for i, split in enumerate(splits):
-                    node = self._downstream_nodes[i]
-                    futures.append(executor.submit(node._process, split))
-            else:
-                # Pass complete data to each downstream node
-                for downstream in self._downstream_nodes:
-                    futures.append(executor.submit(downstream._process, data))
+        try:
+            self._push_with_executor(self._executor, data)
+        except:
+            # end() is not called when the pipeline fails, so shutdown now
+            self.end()
+            raise
+
+    def _push_with_executor(self, executor, data):
+        """Submit the data to the downstream nodes and wait for the results"""
+        futures = []
+
+        do_split = self.context.get("split", False)
+        info(
+            "%s: split=%s, %d downstream nodes"
+            % (self.__class__.__name__, do_split, len(self._downstream_nodes)),
+            label="push",
+        )
 
-            # Wait for results
-            for future in self.__class__.as_completed_func(futures):
-                future.result()
+        if do_split:
+            # Split the data among the downstream nodes
+            splits = divide_data(data, len(self._downstream_nodes))
+            for i, split in enumerate(splits):
+                node = self._downstream_nodes[i]
+                futures.append(executor.submit(node._process, split))
+        else:
+            # Pass complete data to each downstream node
+            for downstream in self._downstream_nodes:
+                futures.append(executor.submit(downstream._process, data))
+
+        # Wait for results
+        for future in self.__class__.as_completed_func(futures):
+            future.result()
 
 
 class ProcessPoolPush(FuturesPush):
@@ -251,9 +348,17 @@ class Reduce(Node):
         """Collect results from previous nodes"""
         self.results.append(data)
 
+    def take_results(self):
+        """Hand off the collected results and drop this node's reference to
+        them, so intermediate copies (such as the unflattened list) can be
+        freed while downstream nodes process the data"""
+        results = self.results
+        self.results = []
+        return results
+
     def end(self):
         """Do the push once all results are in"""
-        results = self.results
+        results = self.take_results()
         if results and self.context.get("flatten", False):
             results = flatten(results)
         self.push(results)
@@ -277,7 +382,7 @@ class Return(Reduce):
 
     def end(self):
         """Collects upstream data and sets the result in the global state"""
-        results = self.results
+        results = self.take_results()
         if results and self.context.get("flatten", False):
             results = flatten(results)
         self.set_global_results(results)
@@ -337,11 +442,14 @@ class FuturesReduce(Reduce):
 
     def end(self):
         """Do the push once all Futures results are in"""
-        dbg("Waiting for %d futures..." % len(self.results))
+        futures = self.take_results()
+        dbg("Waiting for %d futures..." % len(futures))
         timeout = self.context.get("timeout", None)
         results = []
-        for future in as_completed(self.results, timeout=timeout):
+        for future in as_completed(futures, timeout=timeout):
             results.append(future.result())
+        # The futures hold references to their results as well
+        del futures
         if results and self.context.get("flatten", False):
             results = flatten(results)
         self.push(results)
@@ -366,7 +474,8 @@ class AsyncIOFuturesReduce(Reduce):
 
     def end(self):
         """Do the push once all Futures results are in"""
-        dbg("Waiting for %d async futures..." % len(self.results))
+        futures = self.take_results()
+        dbg("Waiting for %d async futures..." % len(futures))
         timeout = self.context.get("timeout", None)
         close = self.context.get("close", None)
 
@@ -374,14 +483,14 @@ class AsyncIOFuturesReduce(Reduce):
 
         try:
             done, pending = loop.run_until_complete(
-                asyncio.wait(self.results, timeout=timeout)
+                asyncio.wait(futures, timeout=timeout)
             )
             if timeout and pending:
                 cancel_asyncio_tasks(
                     pending, loop, cancel_timeout=ASYNCIO_CANCEL_TIMEOUT
                 )
                 raise asyncio.TimeoutError(
-                    "%d/%d tasks pending" % (len(pending), len(self.results))
+                    "%d/%d tasks pending" % (len(pending), len(futures))
                 )
             results = [task.result() for task in done]
         finally:
@@ -12,6 +12,9 @@ from glide.sql_utils import (
 )
 from glide.utils import dbg, raiseif, raiseifnot
 
+# The number of rows per fetch when a cursor-based node is passed chunksize=True
+DEFAULT_FETCH_CHUNKSIZE = 1000
+
 
 class SQLCursorPushMixin:
     """Shared logic for SQL cursor-based nodes"""
@@ -23,9 +26,13 @@ class SQLCursorPushMixin:
         ----------
         cursor
             A cursor-like object with fetchmany and fetchall methods
-        chunksize : int, optional
-            If truthy the data will be fetched and pushed in chunks
+        chunksize : int or bool, optional
+            If truthy the data will be fetched and pushed in chunks. If True,
+            chunks of DEFAULT_FETCH_CHUNKSIZE rows are used.
         """
+        if chunksize is True:
+            chunksize = DEFAULT_FETCH_CHUNKSIZE
+
         if chunksize:
             while True:
                 chunk = cursor.fetchmany(chunksize)
@@ -47,6 +54,10 @@ class BaseSQLNode(SkipFalseNode):
     """
 
     allowed_conn_types = None
+    _allowed_conn_tuple = None
+    _conn = None
+    _conn_is_sqlalchemy = False
+    _conn_is_sqlite = False
 
     def __init__(self, *args, **kwargs):
         raiseifnot(
@@ -57,6 +68,8 @@ class BaseSQLNode(SkipFalseNode):
                 % self.__class__.__name__
             ),
         )
+        # Freeze the allowed types once for isinstance checks
+        self._allowed_conn_tuple = tuple(self.allowed_conn_types)
         super().__init__(*args, **kwargs)
 
     def begin(self):
@@ -68,8 +81,33 @@ class BaseSQLNode(SkipFalseNode):
         )
         self.check_conn(conn)
 
+        # Resolve the connection type once rather than on every query
+        self._conn = conn
+        self._conn_is_sqlalchemy = is_sqlalchemy_conn(conn)
+        self._conn_is_sqlite = isinstance(conn, sqlite3.Connection)
+
+    def end(self):
+        """Release the reference to the connection from begin()"""
+        self._conn = None
+        self._conn_is_sqlalchemy = False
+        self._conn_is_sqlite = False
+
+    def _is_sqlalchemy_conn(self, conn):
+        """Check if conn is a SQLAlchemy conn, reusing the result from begin()
+        if it is the same connection"""
+        if conn is self._conn:
+            return self._conn_is_sqlalchemy
+        return is_sqlalchemy_conn(conn)
+
+    def _is_sqlite_conn(self, conn):
+        """Check if conn is a sqlite3 conn, reusing the result from begin() if
+        it is the same connection"""
+        if conn is self._conn:
+            return self._conn_is_sqlite
+        return isinstance(conn, sqlite3.Connection)
+
     def _is_allowed_conn(self, conn):
-        return isinstance(conn, tuple(self.allowed_conn_types))
+        return isinstance(conn, self._allowed_conn_tuple)
 
     def check_conn(self, conn):
         """Check the database connection"""
@@ -81,7 +119,7 @@ class BaseSQLNode(SkipFalseNode):
 
     def get_sql_executor(self, conn, cursor_type=None):
         """Get the object that can execute queries"""
-        if is_sqlalchemy_conn(conn):
+        if self._is_sqlalchemy_conn(conn):
             return conn
         return conn.cursor(cursor_type) if cursor_type else conn.cursor()
 
@@ -91,7 +129,7 @@ class BaseSQLNode(SkipFalseNode):
         which should have commit/rollback methods."""
 
         dbg("starting transaction: %s" % conn)
-        if is_sqlalchemy_conn(conn):
+        if self._is_sqlalchemy_conn(conn):
             return conn.begin()
 
         # For SQLite and DBAPI connections we explicitly call begin.
@@ -163,7 +201,7 @@ class BaseSQLNode(SkipFalseNode):
             dbg(drop_sql)
             self.execute(conn, cursor, drop_sql)
 
-        if isinstance(conn, sqlite3.Connection):
+        if self._is_sqlite_conn(conn):
             get_create_sql = (
                 "SELECT sql FROM sqlite_master WHERE type='table' AND name=?"
             )
@@ -215,7 +253,7 @@ class BaseSQLNode(SkipFalseNode):
             cursor object that has executed but not fetched a query.
         """
         params = params or ()
-        if is_sqlalchemy_conn(conn):
+        if self._is_sqlalchemy_conn(conn):
             qr = conn.execute(sql, *params, **kwargs)
             return qr
         qr = cursor.execute(sql, params, **kwargs)
@@ -240,7 +278,7 @@ class BaseSQLNode(SkipFalseNode):
         cursor
             cursor object that has executed but not fetched a query.
         """
-        if is_sqlalchemy_conn(conn):
+        if self._is_sqlalchemy_conn(conn):
             qr = conn.execute(sql, rows)
             return qr
         qr = cursor.executemany(sql, rows)
@@ -270,12 +308,12 @@ class BaseSQLNode(SkipFalseNode):
         A SQL bulk load query of the given stmt_type
 
         """
-        if is_sqlalchemy_conn(conn):
+        if self._is_sqlalchemy_conn(conn):
             return get_bulk_statement(
                 stmt_type, table, rows[0].keys(), dicts=False, odku=odku
             )
 
-        if isinstance(conn, sqlite3.Connection):
+        if self._is_sqlite_conn(conn):
             raiseifnot(
                 isinstance(rows[0], sqlite3.Row), "Only sqlite3.Row rows are supported"
             )
@@ -382,8 +420,9 @@ class SQLFetch(Node, SQLCursorPushMixin):
         ----------
         cursor
             A cursor-like object that can fetch results
-        chunksize : int, optional
-            Fetch and push data in chunks of this size
+        chunksize : int or bool, optional
+            Fetch and push data in chunks of this size. If True, use
+            DEFAULT_FETCH_CHUNKSIZE. By default all rows are fetched at once.
 
         """
         self.do_push(cursor, chunksize=chunksize)
@@ -451,7 +490,7 @@ class AssertSQL(SQLNode):
         fetcher = self.execute(conn, cursor, sql, params=params, **kwargs)
         result = fetcher.fetchone()
 
-        if isinstance(conn, sqlite3.Connection):
+        if self._is_sqlite_conn(conn):
             raiseifnot(
                 isinstance(result, sqlite3.Row),
                 "Only sqlite3.Row rows are supported for sqlite3 connections",
@@ -461,7 +461,11 @@ def nchunks(a, n):
 def divide_data(data, n):
     """Divide data into n chunks, with special handling for pandas objects"""
     if is_pandas(data):
-        return np.array_split(data, n)
+        # Same chunk sizes as np.array_split. Each slice is copied once so
+        # downstream nodes can not modify the caller's data through it.
+        return [
+            data.iloc[r.start : r.stop].copy() for r in nchunks(range(len(data)), n)
+        ]
     else:
         return nchunks(data, n)
 
@@ -719,6 +723,12 @@ def cancel_asyncio_tasks(tasks, loop, cancel_timeout=None):
 # -------- Logging utils
 
 
+def dbg_enabled(logger=None):
+    """Check if debug messages would be logged, so callers can skip building
+    expensive messages"""
+    return (logger or default_logger).isEnabledFor(logging.DEBUG)
+
+
 def dbg(msg, **kwargs):
     """Call tlbx dbg with glide logger"""
     kwargs["logger"] = kwargs.get("logger", default_logger)
@@ -42,6 +42,7 @@ for repo in git_requires:
 
 extras_require = {
     "swifter": ["swifter~=1.0.6"],
+    "numba": ["numba~=0.51.2"],
     "rq": ["rq~=1.5.0"],
     "celery": [
         "celery[redis]==4.4.0",
@@ -0,0 +1,37 @@
+import json
+
+import numpy as np
+
+from glide.extensions.numba import *
+from ..test_utils import *
+
+
+def sum_squares(arr):
+    total = 0.0
+    for i in range(arr.shape[0]):
+        total += arr[i] * arr[i]
+    return total
+
+
+def to_json(data):
+    return json.dumps(data)
+
+
+def test_numba_split_apply():
+    glider = Glider(
+        SplitPush("split", split_count=4)
+        | NumbaApply("apply", func=sum_squares)
+        | Return("return")
+    )
+    data = np.arange(100, dtype=np.float64)
+    val = glider.consume([data])
+    assert len(val) == 4
+    assert sum(val) == sum_squares(data)
+    assert NumbaApply.get_jit_func(sum_squares) is NumbaApply.get_jit_func(sum_squares)
+
+
+def test_numba_apply_fallback():
+    glider = Glider(NumbaApply("apply", func=to_json) | Return("return"))
+    val = glider.consume([[1, 2], [3]], apply=dict(fallback=True))
+    assert val == ["[1, 2]", "[3]"]
+    assert NumbaApply.get_jit_func(to_json) is to_json
@@ -1,3 +1,5 @@
+import pytest
+
 from ..test_utils import *
 from glide import *
 from glide.extensions.pandas import *
@@ -23,6 +25,19 @@ def test_from_dataframe(rootdir):
     glider.consume([infile], extract=dict(nrows=50))
 
 
+class DataFrameChunkPush(DataFramePush):
+    def run(self, df, chunksize=None):
+        self.do_push(df, chunksize=chunksize)
+
+
+def test_dataframe_chunked_push():
+    df = pd.DataFrame(dict(a=range(10)))
+    glider = Glider(DataFrameChunkPush("push") | Return("return"))
+    chunks = glider.consume([df], push=dict(chunksize=4))
+    assert [len(x) for x in chunks] == [4, 4, 2]
+    assert pd.concat(chunks).equals(df)
+
+
 def test_dataframe_csv_extract_and_load(rootdir):
     nodes = DataFrameCSVExtract("extract") | DataFrameCSVLoad(
         "load", index=False, mode="a"
@@ -153,6 +168,36 @@ def test_dataframe_sqlite_extract_and_load(rootdir, sqlite_in_conn, sqlite_out_c
     )
 
 
+def test_dataframe_sqlite_empty_load(rootdir, sqlite_out_conn):
+    nodes = DataFrameSQLLoad("load") | Return("return")
+    glider = Glider(nodes)
+    df = pd.DataFrame()
+    val = glider.consume([df], load=dict(table="empty", conn=sqlite_out_conn))
+    assert val[0] is df
+
+    val = glider.consume([None, []], load=dict(table="empty", conn=sqlite_out_conn))
+    assert val == [None, []]
+
+
+class SQLiteOnlyLoad(DataFrameSQLLoad):
+    allowed_conn_types = [sqlite3.Connection]
+
+
+def test_dataframe_sql_conn_check(sqlite_out_conn):
+    df = pd.DataFrame()
+    glider = Glider(SQLiteOnlyLoad("load") | Return("return"))
+    with pytest.raises(AssertionError):
+        glider.consume([df], load=dict(table="empty", conn=object()))
+
+    # Types added after the class is defined are respected by new nodes
+    SQLiteOnlyLoad.allowed_conn_types.append(object)
+    glider = Glider(SQLiteOnlyLoad("load") | Return("return"))
+    val = glider.consume([df], load=dict(table="empty", conn=object()))
+    assert val[0] is df
+    val = glider.consume([df], load=dict(table="empty", conn=sqlite_out_conn))
+    assert val[0] is df
+
+
 # TODO: This test is running into issues since upgrading pandas > 1.0
 # def test_dataframe_sql_process_pool_paraglider(rootdir):
 #     in_table, out_table = db_tables()
@@ -2,6 +2,7 @@ import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures._base import TimeoutError
 import datetime
+import logging
 import os
 import shutil
 import sys
@@ -24,12 +25,55 @@ def test_placeholder_node(rootdir):
         glider.consume([infile], extract=dict(chunksize=10, nrows=20), load=dict(f=f))
 
 
+class DoublePush(PushNode):
+    def run(self, data):
+        self.push(data * 2)
+
+
+def test_push_node_passthrough():
+    assert PlaceholderNode._pure_passthrough
+    assert not DoublePush._pure_passthrough
+    assert DoublePush.process is Node._process_data
+    glider = Glider(PlaceholderNode("extract") | DoublePush("double") | Return("load"))
+    val = glider.consume(range(0, 3))
+    assert val == [0, 2, 4]
+
+
+def test_push_node_passthrough_debug_logging(caplog):
+    caplog.set_level(logging.DEBUG, logger="glide")
+    glider = Glider(PlaceholderNode("extract") | Return("load"))
+    glider.consume(range(0, 3))
+    messages = [r.getMessage() for r in caplog.records]
+    assert sum("extract" in m and "size:" in m for m in messages) == 3
+
+
+def test_global_state_run_arg():
+    glider = Glider(
+        ContextValueTest("values") | Return("return"),
+        global_state=dict(value=5),
+    )
+    val = glider.consume(range(0, 2))
+    assert val == [5, 5]
+
+    glider = Glider(ContextValueTest("values") | Return("return"))
+    with pytest.raises(AssertionError):
+        glider.consume(range(0, 2))
+
+
 def test_return_value():
     glider = Glider(Return("load"))
     val = glider.consume(range(0, 10))
     assert val == list(range(0, 10))
 
 
+def test_reduce_releases_results():
+    glider = Glider(Reduce("reduce", flatten=True) | Return("return"))
+    val = glider.consume([[1, 2], [3]])
+    assert val == [[1, 2, 3]]
+    assert glider["reduce"].results == []
+    assert glider["return"].results == []
+
+
 def test_invalid_node_name():
     with pytest.raises(AssertionError):
         glider = Glider(PlaceholderNode("data") | Print("load"))
@@ -446,6 +490,7 @@ if sys.version_info.major == 3 and sys.version_info.minor >= 7:
         start = time.time()
         glider.consume([infile], transform=dict(func=async_sleep))
         print("Took %.2fs" % (time.time() - start))
+        assert glider["reduce"].results == []
 
     def test_asyncio_timeout(rootdir):
         nodes = (
@@ -516,6 +561,63 @@ def test_update_downstream_context_required_arg(rootdir):
     glider.consume([infile])
 
 
+class RunArgsTest(Node):
+    def run(self, data, a, b, c=1, d=None, **kwargs):
+        self.push(data)
+
+
+def test_run_args_cache():
+    node1 = RunArgsTest("node1")
+    node2 = RunArgsTest("node2")
+    assert list(node1.run_args) == ["a", "b"]
+    assert dict(node1.run_kwargs) == dict(c=1, d=None)
+    assert node1.run_args is not node2.run_args
+    assert "_run_args_cache" in RunArgsTest.__dict__
+    assert "_run_args_cache" not in Node.__dict__
+
+    if sys.version_info >= (3, 8):
+        # Positional-only params need 3.8+ syntax
+        namespace = {}
+        exec(
+            "class PosOnlyTest(Node):\n"
+            "    def run(self, data, x, a=1, /, b=2, **kwargs):\n"
+            "        self.push(data)\n",
+            globals(),
+            namespace,
+        )
+        node = namespace["PosOnlyTest"]("node")
+        assert list(node.run_args) == ["x", "a"]
+        assert dict(node.run_kwargs) == dict(b=2)
+
+
+class VarArgsTest(Node):
+    def run(self, data, *args):
+        self.push(data)
+
+
+class NoDataPush(PushNode):
+    run_requires_data = False
+
+    def run(self, n=3, **kwargs):
+        for i in range(n):
+            self.push(i)
+
+
+def test_process_specialization():
+    assert RunArgsTest.process is Node._process_data
+    assert DateWindowPush.process is Node._process_no_data
+    assert PlaceholderNode.process is PushNode.process
+    assert NoDataPush.process is Node._process_no_data
+    glider = Glider(NoDataPush("gen") | Return("return"))
+    val = glider.consume([None])
+    assert val == [0, 1, 2]
+
+
+def test_run_var_args_not_allowed():
+    with pytest.raises(AssertionError):
+        VarArgsTest("node")
+
+
 def test_context_push_node(rootdir):
     nodes = (
         CSVExtract("extract", nrows=10)
@@ -526,6 +628,21 @@ def test_context_push_node(rootdir):
     glider.consume([infile])
 
 
+class ContextValueTest(Node):
+    def run(self, data, value):
+        self.push(value)
+
+
+def test_context_change_between_items():
+    glider = Glider(
+        ContextPush("context", func=lambda node, data: dict(value=data * 2))
+        | ContextValueTest("values", value=None)
+        | Return("return")
+    )
+    val = glider.consume(range(0, 3))
+    assert val == [0, 2, 4]
+
+
 def test_config_context_json(rootdir):
     nodes = CSVExtract(
         "extract", nrows=ConfigContext(rootdir + "/config_context.json", key="nrows")
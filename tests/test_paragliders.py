@@ -1,4 +1,8 @@
+from concurrent.futures.process import BrokenProcessPool
 import datetime
+import os
+
+import pytest
 
 from .test_utils import *
 from glide import *
@@ -16,6 +20,33 @@ def test_return_value_paraglider():
     assert len(val) == 2
 
 
+def test_paraglider_executor_reuse():
+    with ProcessPoolParaGlider(Return("return")) as glider:
+        val1 = glider.consume([range(0, 5)], synchronous=True, split_count=1)
+        executor = glider._executor
+        val2 = glider.consume([range(5, 10)], synchronous=True, split_count=1)
+        assert glider._executor is executor
+    assert glider._executor is None
+    assert val1 == [[range(0, 5)]] and val2 == [[range(5, 10)]]
+
+
+class ExitNode(Node):
+    def run(self, data):
+        if data == "exit":
+            os._exit(1)
+        self.push(data)
+
+
+def test_paraglider_broken_executor():
+    with ProcessPoolParaGlider(ExitNode("exit") | Return("return")) as glider:
+        with pytest.raises(BrokenProcessPool):
+            glider.consume(["exit"], synchronous=True, split_count=1)
+        executor = glider._executor
+        val = glider.consume([1], synchronous=True, split_count=1)
+        assert glider._executor is not executor
+    assert val == [[1]]
+
+
 def test_noinput_process_pool_paraglider():
     # NOTE: this example doesn't make a lot of sense since it uses the same
     # date windows in each process, but shows the ParaGlider has the ability
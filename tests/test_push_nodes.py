@@ -1,3 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
 from .test_utils import *
 from glide import *
 
@@ -14,6 +19,28 @@ def test_split_push():
     glider.consume([range(4)])
 
 
+def test_split_push_dataframe():
+    df = pd.DataFrame(dict(a=range(10)), index=range(100, 110))
+    glider = Glider(SplitPush("push", split_count=3) | Return("return"))
+    splits = glider.consume([df])
+    assert [len(x) for x in splits] == [4, 3, 3]
+    assert pd.concat(splits).equals(df)
+
+
+class SplitMutate(Node):
+    def run(self, df):
+        df.iloc[0, 0] = 999
+        df["b"] = 1
+        self.push(df)
+
+
+def test_split_push_dataframe_copies():
+    df = pd.DataFrame(dict(a=range(10)))
+    glider = Glider(SplitPush("push", split_count=3) | SplitMutate("mutate"))
+    glider.consume([df])
+    assert df.equals(pd.DataFrame(dict(a=range(10))))
+
+
 def test_split_by_node_push():
     nodes = SplitByNode("push") | [Print("print1"), Print("print2")]
     glider = Glider(nodes)
@@ -53,3 +80,79 @@ def test_thread_pool_push_reduce(rootdir):
         | Print("load4")
     )
     glider.consume([infile])
+
+
+class CountingThreadPoolPush(ThreadPoolPush):
+    executors = []
+
+    def get_executor(self, **executor_kwargs):
+        executor = super().get_executor(**executor_kwargs)
+        self.executors.append(executor)
+        return executor
+
+
+def test_thread_pool_push_executor_reuse():
+    CountingThreadPoolPush.executors = []
+    glider = Glider(
+        IterPush("iter")
+        | CountingThreadPoolPush("push")
+        | [Print("load1"), Print("load2")]
+    )
+    glider.consume([range(4)])
+    assert len(CountingThreadPoolPush.executors) == 1
+    assert glider["push"]._executor is None
+
+
+class RaiseNode(Node):
+    def run(self, data):
+        raise ValueError("downstream failure")
+
+
+def test_futures_push_downstream_error():
+    CountingThreadPoolPush.executors = []
+    glider = Glider(
+        IterPush("iter")
+        | CountingThreadPoolPush("push")
+        | [RaiseNode("raise"), Print("load")]
+    )
+    with pytest.raises(ValueError):
+        glider.consume([range(4)])
+    assert glider["push"]._executor is None
+    assert CountingThreadPoolPush.executors[0]._shutdown
+
+    # A stale executor left by a failed run is shutdown by the next begin()
+    stale = ThreadPoolExecutor(max_workers=1)
+    glider = Glider(
+        IterPush("iter") | ThreadPoolPush("push") | [Print("load1"), Print("load2")]
+    )
+    glider["push"]._executor = stale
+    glider.consume([range(4)])
+    assert stale._shutdown
+
+    glider = Glider(
+        IterPush("iter") | ProcessPoolPush("push") | [RaiseNode("raise"), Print("load")]
+    )
+    with pytest.raises(ValueError):
+        glider.consume([range(4)])
+    assert glider["push"]._executor is None
+
+
+def test_thread_pool_push_shared_executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        glider = Glider(
+            IterPush("iter") | ThreadPoolPush("push") | [Print("load1"), Print("load2")]
+        )
+        glider.consume([range(4)], push=dict(executor=executor))
+        glider.consume([range(4)], push=dict(executor=executor))
+        assert executor.submit(sum, [1, 2]).result() == 3
+
+
+def test_futures_push_auto_executor_mode():
+    glider = Glider(
+        IterPush("iter")
+        | FuturesPush("push", executor_mode="auto")
+        | Func("double", func=lambda x: x * 2)
+        | Return("return")
+    )
+    val = glider.consume([range(3)])
+    assert val == [0, 2, 4]
@@ -235,3 +235,11 @@ def test_conflicting_inject_args():
         )
         def _test(glide_data, node_contexts, chunksize=None):
             gs_glider.consume(glide_data, **node_contexts)
+
+
+def test_blacklisted_args():
+    script = gs_glider.cli(blacklist=["load_table", "cursor"])
+    names = [a.name for a in script.script_args]
+    assert "--load_table" not in names
+    assert "--load_cursor" not in names and "--extract_cursor" not in names
+    assert "--load_stmt_type" in names
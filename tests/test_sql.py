@@ -284,3 +284,12 @@ def test_sql_chunked_extract_and_load(rootdir, sqlite_in_conn, sqlite_out_conn):
         load=dict(conn=sqlite_out_conn, table=table),
     )
     sqlite_out_conn.commit()
+
+
+def test_sql_default_chunked_extract(rootdir, sqlite_in_conn, monkeypatch):
+    monkeypatch.setattr("glide.sql.DEFAULT_FETCH_CHUNKSIZE", 300)
+    nodes = SQLExtract("extract") | Return("return")
+    glider, table = sqlite_glider(rootdir, nodes)
+    sql = "select * from %s" % table
+    chunks = glider.consume([sql], extract=dict(conn=sqlite_in_conn, chunksize=True))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]